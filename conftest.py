@@ -0,0 +1,59 @@
+"""Shared fixtures for the top-level bridge test scripts.
+
+These scripts live outside the configured testpaths, so a plain `pytest`
+run does not collect them; invoking them explicitly (e.g.
+`pytest test_bridge_mcp.py test_mcp_communication.py`) shares one bridge
+process across every test instead of paying the `uv run` startup per
+script.
+"""
+
+import os
+import select
+import subprocess
+import time
+
+import pytest
+
+
+def wait_for_bridge_ready(process, timeout=5.0):
+    """Poll the bridge's stderr for its startup log line instead of sleeping.
+
+    Returns as soon as the bridge has produced output (every log line carries
+    the WorkspaceIsolationBridge prefix), bounded by the timeout.
+    """
+    os.set_blocking(process.stderr.fileno(), False)
+    buffered = b""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        readable, _, _ = select.select([process.stderr], [], [], 0.05)
+        if readable:
+            chunk = process.stderr.read()
+            if chunk:
+                buffered += chunk
+                if b"WorkspaceIsolationBridge" in buffered:
+                    return True
+    return False
+
+
+@pytest.fixture(scope="session")
+def bridge_process():
+    """One Workspace Isolation Bridge shared by every test that requests it."""
+    process = subprocess.Popen(
+        ["uv", "run", "serena-workspace-isolation-bridge", "--debug"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0
+    )
+    assert wait_for_bridge_ready(process), "Bridge did not become ready in time"
+
+    yield process
+
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
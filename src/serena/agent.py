@@ -27,7 +27,6 @@ from serena.config.serena_config import Project, SerenaConfig, get_serena_manage
 from serena.constants import (
     SERENA_LOG_FORMAT,
 )
-from serena.dashboard import MemoryLogHandler, SerenaDashboardAPI
 from serena.prompt_factory import SerenaPromptFactory
 from serena.symbol import SymbolManager
 from serena.tools import Tool, ToolRegistry
@@ -52,7 +51,7 @@ class ProjectNotFoundError(Exception):
 
 class LinesRead:
     def __init__(self) -> None:
-        self.files: dict[str, set[tuple[int, int]]] = defaultdict(lambda: set())
+        self.files: dict[str, set[tuple[int, int]]] = defaultdict(set)
 
     def add_lines_read(self, relative_path: str, lines: tuple[int, int]) -> None:
         self.files[relative_path].add(lines)
@@ -248,6 +247,9 @@ class SerenaAgent:
 
         # start the dashboard (web frontend), registering its log handler
         if self.serena_config.web_dashboard:
+            # import here to avoid paying the Flask import cost when the dashboard is disabled
+            from serena.dashboard import MemoryLogHandler, SerenaDashboardAPI
+
             dashboard_log_handler = MemoryLogHandler(level=serena_log_level)
             Logger.root.addHandler(dashboard_log_handler)
             self._dashboard_thread, port = SerenaDashboardAPI(dashboard_log_handler, tool_names).run_in_thread()
@@ -343,8 +345,9 @@ class SerenaAgent:
         Checks if the given path is ignored by git. Non absolute paths are assumed to be relative to the project root.
         """
         path = Path(path)
+        project_root = self.get_project_root()
         if path.is_absolute():
-            relative_path = path.relative_to(self.get_project_root())
+            relative_path = path.relative_to(project_root)
         else:
             relative_path = path
 
@@ -352,7 +355,7 @@ class SerenaAgent:
         if len(relative_path.parts) > 0 and relative_path.parts[0] == ".git":
             return True
 
-        return match_path(str(relative_path), self.ignore_spec, root_path=self.get_project_root())
+        return match_path(str(relative_path), self.ignore_spec, root_path=project_root)
 
     def validate_relative_path(self, relative_path: str) -> None:
         """
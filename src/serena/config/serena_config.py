@@ -6,7 +6,7 @@ import os
 import shutil
 from copy import deepcopy
 from dataclasses import dataclass, field
-from functools import cached_property
+from functools import cache, cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Self, TypeVar
 
@@ -43,8 +43,9 @@ def get_serena_managed_dir(project_root: str | Path) -> str:
     return os.path.join(project_root, SERENA_MANAGED_DIR_NAME)
 
 
+@cache
 def is_running_in_docker() -> bool:
-    """Check if we're running inside a Docker container."""
+    """Check if we're running inside a Docker container (cached, as the answer cannot change at runtime)."""
     # Check for Docker-specific files
     if os.path.exists("/.dockerenv"):
         return True
@@ -1,6 +1,7 @@
 import glob
 import os
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import NamedTuple
 
@@ -30,37 +31,54 @@ def scan_directory(
     :param is_ignored_file: a function with which to determine whether the given file (abs. path) shall be ignored
     :return: the list of directories and files
     """
-    files = []
-    directories = []
+    files: list[str] = []
+    directories: list[str] = []
 
     abs_path = os.path.abspath(path)
     rel_base = os.path.abspath(relative_to) if relative_to else None
-
-    with os.scandir(abs_path) as entries:
-        for entry in entries:
-            entry_path = entry.path
-
-            if rel_base:
-                result_path = os.path.relpath(entry_path, rel_base)
-            else:
-                result_path = entry_path
-
-            if entry.is_file():
-                if not is_ignored_file(entry_path):
-                    files.append(result_path)
-            elif entry.is_dir():
-                if not is_ignored_dir(entry_path):
-                    directories.append(result_path)
-                    if recursive:
-                        sub_result = scan_directory(
-                            entry_path,
-                            recursive=True,
-                            relative_to=relative_to,
-                            is_ignored_dir=is_ignored_dir,
-                            is_ignored_file=is_ignored_file,
-                        )
-                        files.extend(sub_result.files)
-                        directories.extend(sub_result.directories)
+    # precompute the prefix to strip, avoiding an os.path.relpath call per entry
+    rel_prefix = rel_base + os.sep if rel_base else None
+
+    def to_result_path(entry_path: str) -> str:
+        if rel_base is None:
+            return entry_path
+        if rel_prefix and entry_path.startswith(rel_prefix):
+            return entry_path[len(rel_prefix) :]
+        return os.path.relpath(entry_path, rel_base)
+
+    def scan_single_dir(dir_path: str) -> tuple[list[str], list[str], list[str]]:
+        """Scan one directory, returning (files, directories, subdirectories to descend into)."""
+        sub_files: list[str] = []
+        sub_dirs: list[str] = []
+        descend_dirs: list[str] = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                entry_path = entry.path
+                if entry.is_file():
+                    if not is_ignored_file(entry_path):
+                        sub_files.append(to_result_path(entry_path))
+                elif entry.is_dir():
+                    if not is_ignored_dir(entry_path):
+                        sub_dirs.append(to_result_path(entry_path))
+                        descend_dirs.append(entry_path)
+        return sub_files, sub_dirs, descend_dirs
+
+    if not recursive:
+        files, directories, _ = scan_single_dir(abs_path)
+        return ScanResult(directories, files)
+
+    # Recursive case: directory reads release the GIL, so overlapping the scandir calls
+    # with a small thread pool hides I/O latency on large or slow (e.g. networked) trees.
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        pending = {executor.submit(scan_single_dir, abs_path)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                sub_files, sub_dirs, descend_dirs = future.result()
+                files.extend(sub_files)
+                directories.extend(sub_dirs)
+                for descend_dir in descend_dirs:
+                    pending.add(executor.submit(scan_single_dir, descend_dir))
 
     return ScanResult(directories, files)
 
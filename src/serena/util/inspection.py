@@ -32,22 +32,18 @@ def determine_programming_language_composition(repo_path: str, rel_path_to_gitig
     if not all_files:
         return {}
 
-    # Count files for each language
+    # Count files for each language in a single pass over the files,
+    # extracting each filename only once instead of once per language
+    matchers = [(str(language), language.get_source_fn_matcher()) for language in Language]
     language_counts: dict[str, int] = {}
     total_files = len(all_files)
 
-    for language in Language:
-        matcher = language.get_source_fn_matcher()
-        count = 0
-
-        for file_path in all_files:
-            # Use just the filename for matching, not the full path
-            filename = os.path.basename(file_path)
+    for file_path in all_files:
+        # Use just the filename for matching, not the full path
+        filename = os.path.basename(file_path)
+        for language_name, matcher in matchers:
             if matcher.is_relevant_filename(filename):
-                count += 1
-
-        if count > 0:
-            language_counts[str(language)] = count
+                language_counts[language_name] = language_counts.get(language_name, 0) + 1
 
     # Convert counts to percentages
     language_percentages: dict[str, float] = {}
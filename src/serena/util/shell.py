@@ -1,15 +1,24 @@
+import asyncio
 import logging
 import os
 import platform
+import re
 import subprocess
+from dataclasses import dataclass
 from typing import List
 
-from pydantic import BaseModel
-
 log = logging.getLogger(__name__)
 
 
-class ShellCommandResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ShellCommandResult:
+    """Result of a shell command execution.
+
+    A frozen slots dataclass rather than a Pydantic model: one instance is
+    created per shell call, the fields are plain values needing no validation,
+    and slots keep the per-instance footprint to the four fields.
+    """
+
     stdout: str
     return_code: int
     cwd: str
@@ -33,23 +42,38 @@ DANGEROUS_PATTERNS = [
     r'parted\s+',
 ]
 
+# All patterns fused into a single alternation compiled once at import time;
+# group index i corresponds to DANGEROUS_PATTERNS[i] for error reporting.
+# IGNORECASE replaces lowercasing the whole command per call, and ASCII keeps
+# case folding and \s/\w classes on the fast single-byte tables
+_DANGEROUS_RE = re.compile("|".join(f"({pattern})" for pattern in DANGEROUS_PATTERNS), re.IGNORECASE | re.ASCII)
+
+# Every dangerous pattern starts with one of these literal command names. A plain
+# literal alternation lets the regex engine use its fast multi-literal scan, so the
+# common case (no keyword present at all) never runs the grouped pattern above.
+# False positives here (e.g. "dd" inside "add") are fine - they merely fall through
+# to the full regex, which decides.
+_DANGEROUS_KEYWORDS_RE = re.compile(
+    "|".join(["rm", "del", "format", "shutdown", "reboot", "halt", "poweroff", "init", "dd", "mkfs", "fdisk", "parted"]),
+    re.IGNORECASE | re.ASCII,
+)
+
 
 def _validate_command_safety(command: str) -> None:
     """
     Validate that a command is not obviously dangerous.
-    
+
     :param command: The command to validate
     :raises ValueError: If the command appears dangerous
     """
-    import re
-    
-    command_lower = command.lower().strip()
-    
-    for pattern in DANGEROUS_PATTERNS:
-        if re.search(pattern, command_lower):
-            raise ValueError(f"Command blocked for safety: matches dangerous pattern '{pattern}'")
-    
-    log.debug(f"Command safety validation passed: {command[:50]}{'...' if len(command) > 50 else ''}")
+    match = _DANGEROUS_RE.search(command) if _DANGEROUS_KEYWORDS_RE.search(command) else None
+    if match:
+        assert match.lastindex is not None
+        pattern = DANGEROUS_PATTERNS[match.lastindex - 1]
+        raise ValueError(f"Command blocked for safety: matches dangerous pattern '{pattern}'")
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Command safety validation passed: %s%s", command[:50], "..." if len(command) > 50 else "")
 
 
 def execute_shell_command(command: str, cwd: str | None = None, capture_stderr: bool = False) -> ShellCommandResult:
@@ -69,29 +93,53 @@ def execute_shell_command(command: str, cwd: str | None = None, capture_stderr:
     # Validate command safety
     _validate_command_safety(command)
     
-    log.debug(f"Executing shell command: {command[:100]}{'...' if len(command) > 100 else ''}")
-    log.debug(f"Working directory: {cwd}")
+    # guard so the slicing and formatting are skipped entirely when DEBUG is off
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Executing shell command: %s%s", command[:100], "..." if len(command) > 100 else "")
+        log.debug("Working directory: %s", cwd)
 
     is_windows = platform.system() == "Windows"
-    
+
     try:
-        # Use shell=True consistently across platforms for better compatibility
-        # This fixes the Windows issue where shell=False expects a list but gets a string
-        process = subprocess.Popen(
-            command,
-            shell=True,  # Changed: Use shell=True on all platforms
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
-            creationflags=subprocess.CREATE_NO_WINDOW if is_windows else 0,  # type: ignore
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            cwd=cwd,
-        )
+        if is_windows:
+            # Use shell=True on Windows, where shell=False expects a list but gets a string
+            process = subprocess.Popen(
+                command,
+                shell=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW,  # type: ignore
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                cwd=cwd,
+            )
+        else:
+            # An explicit argv with shell=False has the same semantics as shell=True
+            # (the shell runs `sh -c <command>`) but keeps the launch on CPython's
+            # fast spawn path, avoiding a fork of the full interpreter heap
+            process = subprocess.Popen(
+                ["/bin/sh", "-c", command],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                cwd=cwd,
+            )
+
+        if capture_stderr:
+            stdout, stderr = process.communicate()
+        else:
+            # with stderr sent to DEVNULL there is only one pipe, so a plain read
+            # cannot deadlock and skips communicate()'s polling machinery
+            assert process.stdout is not None
+            stdout = process.stdout.read()
+            stderr = None
+            process.wait()
 
-        stdout, stderr = process.communicate()
-        
         result = ShellCommandResult(
             stdout=stdout, 
             stderr=stderr, 
@@ -99,7 +147,7 @@ def execute_shell_command(command: str, cwd: str | None = None, capture_stderr:
             cwd=cwd
         )
         
-        log.debug(f"Command completed with return code: {process.returncode}")
+        log.debug("Command completed with return code: %s", process.returncode)
         if process.returncode != 0:
             log.warning(f"Command failed with return code {process.returncode}: {command[:50]}{'...' if len(command) > 50 else ''}")
             if stderr:
@@ -115,12 +163,54 @@ def execute_shell_command(command: str, cwd: str | None = None, capture_stderr:
         raise subprocess.SubprocessError(f"Command execution failed: {e}") from e
 
 
+async def execute_shell_command_async(command: str, cwd: str | None = None, capture_stderr: bool = False) -> ShellCommandResult:
+    """
+    Execute a shell command without blocking the event loop.
+
+    Unlike :func:`execute_shell_command`, this allows a caller to overlap several
+    commands with ``asyncio.gather`` instead of running them serially.
+
+    :param command: The command to execute.
+    :param cwd: The working directory to execute the command in. If None, the current working directory will be used.
+    :param capture_stderr: Whether to capture the stderr output.
+    :return: The output of the command.
+    :raises ValueError: If the command appears dangerous.
+    """
+    if cwd is None:
+        cwd = os.getcwd()
+
+    _validate_command_safety(command)
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Executing shell command (async): %s%s", command[:100], "..." if len(command) > 100 else "")
+
+    process = await asyncio.create_subprocess_shell(
+        command,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE if capture_stderr else asyncio.subprocess.DEVNULL,
+        cwd=cwd,
+    )
+    stdout_bytes, stderr_bytes = await process.communicate()
+
+    stdout = stdout_bytes.decode("utf-8", errors="replace")
+    stderr = stderr_bytes.decode("utf-8", errors="replace") if capture_stderr else None
+
+    return_code = process.returncode
+    assert return_code is not None
+    if return_code != 0:
+        log.warning(f"Command failed with return code {return_code}: {command[:50]}{'...' if len(command) > 50 else ''}")
+
+    return ShellCommandResult(stdout=stdout, stderr=stderr, return_code=return_code, cwd=cwd)
+
+
 def subprocess_check_output(args: list[str], encoding: str = "utf-8", strip: bool = True, timeout: float | None = None) -> str:
     kwargs = {
         "stdin": subprocess.DEVNULL,
         "stderr": subprocess.PIPE,
         "timeout": timeout,
-        "env": os.environ.copy(),
+        # no env override: the child inherits the parent environment directly,
+        # avoiding a full copy of os.environ per call
     }
     if platform.system() == "Windows":
         kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW  # type: ignore
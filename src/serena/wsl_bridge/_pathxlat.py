@@ -0,0 +1,49 @@
+"""
+WSL -> Windows path translation for MCP messages.
+
+Kept as free functions over plain types (no ``self``, no logging) so the module
+can be compiled with mypyc/Cython as-is if the bridge's steady-state profile
+ever warrants it.
+"""
+
+import re
+
+# Matches the /mnt/<drive> prefix of a WSL path (drive must be a single letter)
+_MNT_RE = re.compile(r"^/mnt/([a-zA-Z])(/|$)")
+
+
+def translate_paths(obj: object) -> object:
+    """
+    Recursively translate WSL paths (``/mnt/c/...``) to Windows paths (``C:\\...``)
+    in a decoded MCP message.
+
+    Containers are only copied when a child actually changed, so an untranslated
+    message comes back identical (``result is obj``) with zero allocations and the
+    caller can detect "nothing changed" in O(1).
+    """
+    if isinstance(obj, dict):
+        new_dict = None
+        for k, v in obj.items():
+            tv = translate_paths(v)
+            if tv is not v and new_dict is None:
+                new_dict = dict(obj)
+            if new_dict is not None:
+                new_dict[k] = tv
+        return new_dict if new_dict is not None else obj
+    elif isinstance(obj, list):
+        new_list = None
+        for i, item in enumerate(obj):
+            ti = translate_paths(item)
+            if ti is not item and new_list is None:
+                new_list = list(obj)
+            if new_list is not None:
+                new_list[i] = ti
+        return new_list if new_list is not None else obj
+    elif isinstance(obj, str) and obj.startswith("/mnt/"):
+        # Convert /mnt/c/path/to/file to C:\path\to\file; one precompiled
+        # match plus one replace instead of split/index/join per string
+        m = _MNT_RE.match(obj)
+        if m:
+            return m.group(1).upper() + ":\\" + obj[m.end():].replace('/', '\\')
+
+    return obj
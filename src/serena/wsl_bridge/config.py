@@ -5,16 +5,56 @@ Workspace Isolation Bridge Configuration Management
 Handles loading, saving, and validating configuration for the Workspace Isolation Bridge.
 """
 
+import copy
+import functools
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import logging
 
+try:
+    # optional: Rust-based parser, noticeably faster than the pure-Python json module
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Default configuration template, built once at import time; _get_default_config
+# hands out deep copies so instances can mutate their config freely
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "mcpServers": {
+        "serena": {
+            "command": "/mnt/c/Python/Python312/python.exe",
+            "args": ["-m", "serena.mcp_server"],
+            "env": {
+                "PYTHONPATH": "C:\\\\Users\\\\%USERNAME%\\\\projects\\\\serena",
+                "SERENA_LOG_LEVEL": "INFO"
+            }
+        }
+    },
+    "bridge": {
+        "debug": False,
+        "max_restarts": 3,
+        "restart_cooldown": 10,
+        "translate_paths": True
+    }
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _path_exists(path: str) -> bool:
+    """os.path.exists with a small cache, so validate() in a loop stats each command path once"""
+    return os.path.exists(path)
+
 
 class WorkspaceIsolationBridgeConfig:
     """Configuration manager for Workspace Isolation Bridge"""
-    
+
+    # parsed configs keyed by path, tagged with (st_mtime_ns, st_size) so an
+    # unchanged file is never re-read or re-parsed
+    _cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or self._get_default_config_path()
         self.config_data = {}
@@ -26,12 +66,21 @@ class WorkspaceIsolationBridgeConfig:
         return config_dir / "workspace_isolation_bridge.json"
     
     def load(self) -> Dict[str, Any]:
-        """Load configuration from file"""
+        """Load configuration from file, reusing the cached parse while the file is unchanged"""
+        cache_key = str(self.config_path)
         try:
-            with open(self.config_path, 'r') as f:
-                self.config_data = json.load(f)
-                self.logger.info(f"Loaded config from {self.config_path}")
+            st = os.stat(self.config_path)
+            cached = self._cache.get(cache_key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                # deep copy so callers mutating config_data cannot corrupt the cache
+                self.config_data = copy.deepcopy(cached[2])
                 return self.config_data
+            with open(self.config_path, 'rb') as f:
+                raw = f.read()
+            self.config_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self._cache[cache_key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(self.config_data))
+            self.logger.info(f"Loaded config from {self.config_path}")
+            return self.config_data
         except FileNotFoundError:
             self.logger.warning(f"Config file not found at {self.config_path}, using defaults")
             self.config_data = self._get_default_config()
@@ -116,7 +165,7 @@ class WorkspaceIsolationBridgeConfig:
         command = config["command"]
         if command.startswith("/") or "\\" in command:
             # It's a path, check if it exists
-            if not os.path.exists(command):
+            if not _path_exists(command):
                 self.logger.warning(f"Server '{server_name}' command path does not exist: {command}")
                 # Don't fail validation, just warn - path might be valid in different context
         
@@ -146,25 +195,8 @@ class WorkspaceIsolationBridgeConfig:
         return True
     
     def _get_default_config(self) -> Dict[str, Any]:
-        """Get default configuration"""
-        return {
-            "mcpServers": {
-                "serena": {
-                    "command": "/mnt/c/Python/Python312/python.exe",
-                    "args": ["-m", "serena.mcp_server"],
-                    "env": {
-                        "PYTHONPATH": "C:\\\\Users\\\\%USERNAME%\\\\projects\\\\serena",
-                        "SERENA_LOG_LEVEL": "INFO"
-                    }
-                }
-            },
-            "bridge": {
-                "debug": False,
-                "max_restarts": 3,
-                "restart_cooldown": 10,
-                "translate_paths": True
-            }
-        }
+        """Get a mutable copy of the default configuration"""
+        return copy.deepcopy(_DEFAULT_CONFIG)
     
     def get_effective_config(self) -> Dict[str, Any]:
         """Get the current effective configuration (loaded + defaults)"""
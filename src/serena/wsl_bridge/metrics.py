@@ -6,191 +6,335 @@ Tracks performance metrics for the Workspace Isolation Bridge to help optimize a
 server instance management and communication performance.
 """
 
+import bisect
+import io
+import itertools
 import time
 import threading
-from collections import defaultdict, deque
-from typing import Dict, Any, Optional
+from collections import Counter, defaultdict, deque
+from typing import Dict, Any, List, NamedTuple, Optional
 import logging
 import json
 
+try:
+    # optional: Rust-based encoder, much faster than the pure-Python json module
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _RequestRecord(NamedTuple):
+    """History entry for one request; a fraction of the size of the dict it replaces"""
+
+    timestamp: float
+    method: str
+    duration: float
+    success: bool
+
+
+class _ErrorRecord(NamedTuple):
+    """History entry for one error"""
+
+    timestamp: float
+    error_type: str
+    context: Optional[str]
+
+
+class _MetricsShard:
+    """Per-thread metric counters, written by exactly one thread and therefore lock-free on the write path"""
+
+    __slots__ = (
+        'request_counts',
+        'request_durations',
+        'request_duration_aggregates',
+        'total_requests',
+        'error_counts',
+        'total_errors',
+        'path_translations',
+        'translation_patterns',
+    )
+
+    def __init__(self):
+        self.request_counts = defaultdict(int)
+        # bounded deques drop the oldest duration in O(1) instead of list.pop(0)'s O(n) shift
+        self.request_durations = defaultdict(lambda: deque(maxlen=100))
+        # rolling [sum, min, max] per method so reads do not rescan each window
+        self.request_duration_aggregates = defaultdict(lambda: [0.0, float('inf'), 0.0])
+        self.total_requests = 0
+        self.error_counts = defaultdict(int)
+        self.total_errors = 0
+        self.path_translations = 0
+        self.translation_patterns = defaultdict(int)
+
+    def clear(self) -> None:
+        self.request_counts.clear()
+        self.request_durations.clear()
+        self.request_duration_aggregates.clear()
+        self.total_requests = 0
+        self.error_counts.clear()
+        self.total_errors = 0
+        self.path_translations = 0
+        self.translation_patterns.clear()
+
 
 class BridgeMetrics:
     """Performance metrics tracker for Workspace Isolation Bridge"""
-    
+
     def __init__(self, max_history: int = 1000):
         self.max_history = max_history
+        # the lock only guards the shard registry and merged reads; the record_* hot
+        # paths write to a per-thread shard without any locking
         self.lock = threading.Lock()
-        
-        # Request metrics
-        self.request_counts = defaultdict(int)
-        self.request_durations = defaultdict(list)
+        self._local = threading.local()
+        self._shards: List[_MetricsShard] = []
+
+        # shared history deques; deque.append is atomic under the GIL, so writers
+        # do not need the lock for these either
         self.request_history = deque(maxlen=max_history)
-        
-        # Error metrics
-        self.error_counts = defaultdict(int)
         self.error_history = deque(maxlen=max_history)
-        
-        # System metrics
-        self.start_time = time.time()
-        self.total_requests = 0
-        self.total_errors = 0
-        
-        # Path translation metrics
-        self.path_translations = 0
-        self.translation_patterns = defaultdict(int)
-        
+        # small mirrors of the history tails, so the "recent" views in get_stats
+        # are O(10) copies instead of materializing the full history deques
+        self._recent_requests = deque(maxlen=10)
+        self._recent_errors = deque(maxlen=10)
+
+        # System metrics (monotonic clock: immune to wall-clock jumps, one clock source for all deltas)
+        self.start_time = time.monotonic()
+
         self.logger = logging.getLogger(__name__)
-    
-    def record_request(self, method: str, duration: float, success: bool = True) -> None:
-        """Record a request with its duration"""
+
+    def _get_shard(self) -> _MetricsShard:
+        """Get (or lazily register) the calling thread's shard"""
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = _MetricsShard()
+            with self.lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    @property
+    def total_requests(self) -> int:
         with self.lock:
-            self.total_requests += 1
-            self.request_counts[method] += 1
-            
-            # Keep only recent durations to prevent memory growth
-            if len(self.request_durations[method]) >= 100:
-                self.request_durations[method].pop(0)
-            self.request_durations[method].append(duration)
-            
-            # Record in history
-            self.request_history.append({
-                'timestamp': time.time(),
-                'method': method,
-                'duration': duration,
-                'success': success
-            })
-            
-            if duration > 1.0:  # Log slow requests
-                self.logger.warning(f"Slow request: {method} took {duration:.2f}s")
-    
+            return sum(shard.total_requests for shard in self._shards)
+
+    @property
+    def total_errors(self) -> int:
+        with self.lock:
+            return sum(shard.total_errors for shard in self._shards)
+
+    @property
+    def path_translations(self) -> int:
+        with self.lock:
+            return sum(shard.path_translations for shard in self._shards)
+
+    def record_request(self, method: str, duration: float, success: bool = True, timestamp: Optional[float] = None) -> None:
+        """Record a request with its duration; callers that already read the clock can pass the timestamp in"""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        shard = self._get_shard()
+        shard.total_requests += 1
+        shard.request_counts[method] += 1
+
+        # The deque's maxlen keeps only recent durations to prevent memory growth
+        durations = shard.request_durations[method]
+        aggregate = shard.request_duration_aggregates[method]
+        if len(durations) == durations.maxlen:
+            evicted = durations[0]
+            durations.append(duration)
+            aggregate[0] += duration - evicted
+            if evicted == aggregate[1] or evicted == aggregate[2]:
+                # the evicted value defined the window min/max, rescan just this window
+                aggregate[1] = min(durations)
+                aggregate[2] = max(durations)
+            else:
+                aggregate[1] = min(aggregate[1], duration)
+                aggregate[2] = max(aggregate[2], duration)
+        else:
+            durations.append(duration)
+            aggregate[0] += duration
+            aggregate[1] = min(aggregate[1], duration)
+            aggregate[2] = max(aggregate[2], duration)
+
+        # Record in history
+        record = _RequestRecord(timestamp, method, duration, success)
+        self.request_history.append(record)
+        self._recent_requests.append(record)
+
+        if duration > 1.0:  # Log slow requests
+            self.logger.warning(f"Slow request: {method} took {duration:.2f}s")
+
     def record_error(self, error_type: str, context: Optional[str] = None) -> None:
         """Record an error occurrence"""
-        with self.lock:
-            self.total_errors += 1
-            self.error_counts[error_type] += 1
-            
-            self.error_history.append({
-                'timestamp': time.time(),
-                'error_type': error_type,
-                'context': context
-            })
-            
-            self.logger.info(f"Recorded error: {error_type}")
-    
+        shard = self._get_shard()
+        shard.total_errors += 1
+        shard.error_counts[error_type] += 1
+
+        record = _ErrorRecord(time.monotonic(), error_type, context)
+        self.error_history.append(record)
+        self._recent_errors.append(record)
+
+        self.logger.info(f"Recorded error: {error_type}")
+
     def record_path_translation(self, from_path: str, to_path: str) -> None:
         """Record a path translation"""
-        with self.lock:
-            self.path_translations += 1
-            
-            # Extract pattern (e.g., /mnt/c/ -> C:\)
-            if from_path.startswith("/mnt/"):
-                pattern = f"{from_path.split('/')[1]}/{from_path.split('/')[2]}/ -> {to_path.split(':')[0]}:\\"
-                self.translation_patterns[pattern] += 1
-    
+        shard = self._get_shard()
+        shard.path_translations += 1
+
+        # Count patterns under a two-byte (source drive, target drive) key; only
+        # drive letters vary, so this avoids formatting a pattern string per
+        # translation. get_stats expands the keys back to readable form.
+        if from_path.startswith("/mnt/") and len(from_path) > 5 and to_path:
+            shard.translation_patterns[bytes((ord(from_path[5]), ord(to_path[0])))] += 1
+
     def get_stats(self) -> Dict[str, Any]:
-        """Get comprehensive statistics"""
+        """Get comprehensive statistics, merged across all thread shards"""
         with self.lock:
-            uptime = time.time() - self.start_time
-            
+            uptime = time.monotonic() - self.start_time
+
+            # Merge the per-thread shards; Counter.update sums the count dicts in C
+            # instead of a Python-level per-key loop
+            total_requests = 0
+            total_errors = 0
+            path_translations = 0
+            request_counts: Counter = Counter()
+            error_counts: Counter = Counter()
+            translation_patterns: Counter = Counter()
+            merged_durations: Dict[str, List[deque]] = defaultdict(list)
+            merged_aggregates: Dict[str, List[float]] = defaultdict(lambda: [0.0, float('inf'), 0.0])
+            for shard in self._shards:
+                total_requests += shard.total_requests
+                total_errors += shard.total_errors
+                path_translations += shard.path_translations
+                request_counts.update(shard.request_counts)
+                error_counts.update(shard.error_counts)
+                translation_patterns.update(shard.translation_patterns)
+                for method, durations in shard.request_durations.items():
+                    if durations:
+                        merged_durations[method].append(durations)
+                        aggregate = shard.request_duration_aggregates[method]
+                        merged = merged_aggregates[method]
+                        merged[0] += aggregate[0]
+                        merged[1] = min(merged[1], aggregate[1])
+                        merged[2] = max(merged[2], aggregate[2])
+
             # Calculate request statistics
             request_stats = {}
-            for method, durations in self.request_durations.items():
-                if durations:
-                    request_stats[method] = {
-                        'count': self.request_counts[method],
-                        'avg_duration': sum(durations) / len(durations),
-                        'min_duration': min(durations),
-                        'max_duration': max(durations),
-                        'recent_durations': list(durations)[-10:]  # Last 10 requests
-                    }
-            
+            for method, duration_windows in merged_durations.items():
+                window_size = sum(len(window) for window in duration_windows)
+                duration_sum, duration_min, duration_max = merged_aggregates[method]
+                recent = list(itertools.chain.from_iterable(duration_windows))[-10:]  # Last 10 requests
+                request_stats[method] = {
+                    'count': request_counts[method],
+                    'avg_duration': duration_sum / window_size,
+                    'min_duration': duration_min,
+                    'max_duration': duration_max,
+                    'recent_durations': recent
+                }
+
             # Calculate error rates
-            error_rate = (self.total_errors / max(self.total_requests, 1)) * 100
-            
+            error_rate = (total_errors / max(total_requests, 1)) * 100
+
             # Calculate requests per second
-            rps = self.total_requests / max(uptime, 1)
-            
+            rps = total_requests / max(uptime, 1)
+
             return {
                 'uptime_seconds': uptime,
-                'total_requests': self.total_requests,
-                'total_errors': self.total_errors,
+                'total_requests': total_requests,
+                'total_errors': total_errors,
                 'error_rate_percent': error_rate,
                 'requests_per_second': rps,
                 'request_stats': request_stats,
-                'error_counts': dict(self.error_counts),
+                # the merged Counters are freshly built per call, so they can be
+                # returned directly without another snapshot copy
+                'error_counts': error_counts,
                 'path_translations': {
-                    'total': self.path_translations,
-                    'patterns': dict(self.translation_patterns)
+                    'total': path_translations,
+                    # expand the compact drive-pair keys (e.g. b'cC' -> "mnt/c/ -> C:\")
+                    'patterns': {f"mnt/{chr(k[0])}/ -> {chr(k[1])}:\\": v for k, v in translation_patterns.items()}
                 },
-                'recent_requests': list(self.request_history)[-10:],
-                'recent_errors': list(self.error_history)[-10:]
+                'recent_requests': list(self._recent_requests),
+                'recent_errors': list(self._recent_errors)
             }
-    
+
     def get_performance_summary(self) -> str:
         """Get a human-readable performance summary"""
         stats = self.get_stats()
-        
-        summary = []
-        summary.append(f"Workspace Isolation Bridge Performance Summary")
-        summary.append(f"==============================")
-        summary.append(f"Uptime: {stats['uptime_seconds']:.1f}s")
-        summary.append(f"Total Requests: {stats['total_requests']}")
-        summary.append(f"Total Errors: {stats['total_errors']}")
-        summary.append(f"Error Rate: {stats['error_rate_percent']:.1f}%")
-        summary.append(f"Requests/sec: {stats['requests_per_second']:.2f}")
-        summary.append(f"Path Translations: {stats['path_translations']['total']}")
-        
+
+        # write into a single StringIO buffer instead of accumulating a list of
+        # small strings for "\n".join to re-copy
+        buf = io.StringIO()
+        w = buf.write
+        w("Workspace Isolation Bridge Performance Summary\n")
+        w("==============================\n")
+        w(f"Uptime: {stats['uptime_seconds']:.1f}s\n")
+        w(f"Total Requests: {stats['total_requests']}\n")
+        w(f"Total Errors: {stats['total_errors']}\n")
+        w(f"Error Rate: {stats['error_rate_percent']:.1f}%\n")
+        w(f"Requests/sec: {stats['requests_per_second']:.2f}\n")
+        w(f"Path Translations: {stats['path_translations']['total']}")
+
         if stats['request_stats']:
-            summary.append(f"\nRequest Performance:")
+            w("\n\nRequest Performance:")
             for method, stats_data in stats['request_stats'].items():
                 avg_ms = stats_data['avg_duration'] * 1000
-                summary.append(f"  {method}: {stats_data['count']} requests, avg {avg_ms:.1f}ms")
-        
+                w(f"\n  {method}: {stats_data['count']} requests, avg {avg_ms:.1f}ms")
+
         if stats['error_counts']:
-            summary.append(f"\nError Breakdown:")
+            w("\n\nError Breakdown:")
             for error_type, count in stats['error_counts'].items():
-                summary.append(f"  {error_type}: {count}")
-        
-        return "\n".join(summary)
-    
+                w(f"\n  {error_type}: {count}")
+
+        return buf.getvalue()
+
     def reset(self) -> None:
         """Reset all metrics"""
         with self.lock:
-            self.request_counts.clear()
-            self.request_durations.clear()
+            for shard in self._shards:
+                shard.clear()
             self.request_history.clear()
-            self.error_counts.clear()
             self.error_history.clear()
-            self.translation_patterns.clear()
-            
-            self.start_time = time.time()
-            self.total_requests = 0
-            self.total_errors = 0
-            self.path_translations = 0
-            
+            self._recent_requests.clear()
+            self._recent_errors.clear()
+
+            self.start_time = time.monotonic()
+
             self.logger.info("Metrics reset")
-    
+
     def export_to_file(self, filepath: str) -> None:
         """Export metrics to a JSON file"""
         try:
             stats = self.get_stats()
-            with open(filepath, 'w') as f:
-                json.dump(stats, f, indent=2, default=str)
-            
+            # history records are NamedTuples; expand them to dicts only on the
+            # export path so the JSON keeps its field names
+            stats['recent_requests'] = [r._asdict() for r in stats['recent_requests']]
+            stats['recent_errors'] = [e._asdict() for e in stats['recent_errors']]
+            if orjson is not None:
+                # orjson serializes exact dicts only, so downcast the Counter view here
+                stats['error_counts'] = dict(stats['error_counts'])
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(stats, option=orjson.OPT_INDENT_2, default=str))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(stats, f, indent=2, default=str)
+
             self.logger.info(f"Metrics exported to {filepath}")
-            
+
         except Exception as e:
             self.logger.error(f"Failed to export metrics to {filepath}: {e}")
             raise
-    
+
     def get_recent_performance(self, seconds: int = 60) -> Dict[str, Any]:
         """Get performance stats for the recent time period"""
-        cutoff_time = time.time() - seconds
-        
+        cutoff_time = time.monotonic() - seconds
+
         with self.lock:
-            recent_requests = [r for r in self.request_history if r['timestamp'] > cutoff_time]
-            recent_errors = [e for e in self.error_history if e['timestamp'] > cutoff_time]
-            
+            # the histories are append-only with monotonically increasing timestamps,
+            # so locate the cutoff with a binary search instead of testing every entry
+            requests = list(self.request_history)
+            errors = list(self.error_history)
+            recent_requests = requests[bisect.bisect_right(requests, cutoff_time, key=lambda r: r.timestamp):]
+            recent_errors = errors[bisect.bisect_right(errors, cutoff_time, key=lambda e: e.timestamp):]
+
             if not recent_requests:
                 return {
                     'period_seconds': seconds,
@@ -199,38 +343,42 @@ class BridgeMetrics:
                     'avg_duration': 0,
                     'requests_per_second': 0
                 }
-            
-            total_duration = sum(r['duration'] for r in recent_requests)
+
+            total_duration = sum(r.duration for r in recent_requests)
             avg_duration = total_duration / len(recent_requests)
             rps = len(recent_requests) / seconds
-            
+
             return {
                 'period_seconds': seconds,
                 'request_count': len(recent_requests),
                 'error_count': len(recent_errors),
                 'avg_duration': avg_duration,
                 'requests_per_second': rps,
-                'success_rate': (len([r for r in recent_requests if r.get('success', True)]) / len(recent_requests)) * 100
+                'success_rate': (len([r for r in recent_requests if r.success]) / len(recent_requests)) * 100
             }
 
 
 class MetricsContextManager:
     """Context manager for timing operations"""
-    
+
+    # one instance per timed operation, so skip the per-instance __dict__
+    __slots__ = ('metrics', 'operation_name', 'start_time', 'success')
+
     def __init__(self, metrics: BridgeMetrics, operation_name: str):
         self.metrics = metrics
         self.operation_name = operation_name
         self.start_time = None
         self.success = True
-    
+
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.start_time:
-            duration = time.time() - self.start_time
+            end_time = time.monotonic()
+            duration = end_time - self.start_time
             self.success = exc_type is None
-            self.metrics.record_request(self.operation_name, duration, self.success)
-        
+            self.metrics.record_request(self.operation_name, duration, self.success, timestamp=end_time)
+
         return False  # Don't suppress exceptions
@@ -10,6 +10,8 @@ import sys
 import os
 import json
 import threading
+import select
+import selectors
 import subprocess
 import time
 import signal
@@ -17,10 +19,32 @@ import uuid
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
+import logging.handlers
 
+from ._pathxlat import translate_paths
 from .config import WorkspaceIsolationBridgeConfig
 from .metrics import BridgeMetrics
 
+try:
+    # optional: parses/serializes bytes directly, skipping the str round-trip
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON message from raw bytes"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps_line(obj: Any) -> bytes:
+    """Serialize a JSON message to a newline-terminated NDJSON frame"""
+    if orjson is not None:
+        # OPT_APPEND_NEWLINE frames the message in the same allocation,
+        # instead of a second bytes object from `+ b'\n'`
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + '\n').encode('utf-8')
+
 
 class MCPWorkspaceIsolationBridge:
     """Workspace Isolation Bridge that provides dedicated Serena server instances per workspace"""
@@ -38,6 +62,25 @@ class MCPWorkspaceIsolationBridge:
         self.config_manager = WorkspaceIsolationBridgeConfig(config_path)
         self.config = self.config_manager.load()
         self.metrics = BridgeMetrics()
+        # hoisted out of _translate_paths_recursive, which would otherwise do two
+        # dict lookups per JSON node of every message
+        self._translate_paths_enabled = bool(self.config.get("bridge", {}).get("translate_paths", True))
+
+        # Precompute the server launch parameters once, so (re)starts don't
+        # re-copy the whole process environment each time
+        try:
+            server_name = next(iter(self.config['mcpServers']))
+            server_config = self.config['mcpServers'][server_name]
+            self._server_name = server_name
+            self._server_cmd = [server_config['command'], *server_config['args']]
+            self._server_env = {**os.environ, **server_config.get('env', {})}
+            self._server_cwd = server_config.get('cwd', '.')
+        except (KeyError, StopIteration):
+            self._log("No MCP server defined in configuration")
+            self._server_name = None
+            self._server_cmd = None
+            self._server_env = None
+            self._server_cwd = '.'
         
         # Validate configuration
         if not self.config_manager.validate():
@@ -102,12 +145,21 @@ class MCPWorkspaceIsolationBridge:
         # Setup activity tracking log (shared across all bridges for monitoring)
         self.activity_log_file = os.path.join(tempfile.gettempdir(), 'workspace_isolation_bridge_activity.log')
         
+        # Buffer file output in memory and flush in batches: the file handler
+        # would otherwise issue a write syscall per log record on the message
+        # path. ERROR-level records (and shutdown) still flush immediately.
+        file_handler = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=logging.FileHandler(log_file)
+        )
+
         logging.basicConfig(
             level=log_level,
             format=f'[WorkspaceIsolationBridge-{self.workspace_id}] %(asctime)s - %(levelname)s - %(message)s',
             handlers=[
                 logging.StreamHandler(sys.stderr),
-                logging.FileHandler(log_file)
+                file_handler
             ]
         )
         self.logger = logging.getLogger(__name__)
@@ -156,67 +208,58 @@ class MCPWorkspaceIsolationBridge:
     
     def _translate_paths_recursive(self, obj):
         """Recursively translate WSL paths to Windows paths in MCP messages"""
-        if not self.config.get("bridge", {}).get("translate_paths", True):
-            return obj
-            
-        if isinstance(obj, dict):
-            return {k: self._translate_paths_recursive(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._translate_paths_recursive(item) for item in obj]
-        elif isinstance(obj, str) and obj.startswith("/mnt/"):
-            # Convert /mnt/c/path/to/file to C:\path\to\file
-            parts = obj.split('/')
-            if len(parts) >= 3 and parts[1] == "mnt" and len(parts[2]) == 1:
-                drive = parts[2].upper()
-                windows_path = drive + ":\\" + "\\".join(parts[3:])
-                self._log(f"Path translation: {obj} -> {windows_path}")
-                return windows_path
-        
-        return obj
+        return translate_paths(obj)
     
     def _start_dedicated_server(self):
         """Start a dedicated Serena MCP server on Windows"""
         try:
-            # Get the first (and likely only) server config
-            server_name = next(iter(self.config['mcpServers'].keys()))
-            server_config = self.config['mcpServers'][server_name]
-            
-            self._log(f"Starting dedicated {server_name} server for workspace {self.workspace_id}")
-            
-            # Prepare environment variables
-            env = os.environ.copy()
-            if 'env' in server_config:
-                env.update(server_config['env'])
-            
-            # Start the MCP server process on Windows
+            if self._server_cmd is None:
+                self._log("Cannot start server: no MCP server defined in configuration")
+                return False
+
+            self._log(f"Starting dedicated {self._server_name} server for workspace {self.workspace_id}")
+
+            # Start the MCP server process on Windows, with the command and
+            # environment precomputed in __init__
+            # Binary pipes: the forwarders shuttle raw bytes and parse JSON from
+            # bytes directly, avoiding a UTF-8 decode/encode per message
             self.server_process = subprocess.Popen(
-                [server_config['command']] + server_config['args'],
+                self._server_cmd,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                cwd=server_config.get('cwd', '.'),
-                env=env
+                bufsize=0,
+                cwd=self._server_cwd,
+                env=self._server_env
             )
             
-            # Give it a moment to start
-            time.sleep(0.5)
-            
+            # Probe for readiness instead of sleeping a blind 500ms: stop waiting
+            # as soon as the server dies or says anything on stdout/stderr (most
+            # servers log a startup banner), bounded by the old 500ms worst case
+            deadline = time.monotonic() + 0.5
+            probe_fds = [self.server_process.stdout, self.server_process.stderr]
+            while time.monotonic() < deadline:
+                if self.server_process.poll() is not None:
+                    break
+                readable, _, _ = select.select(probe_fds, [], [], 0.02)
+                if readable:
+                    break
+
             # Check if it started successfully
             if self.server_process.poll() is not None:
-                stderr_output = self.server_process.stderr.read() if self.server_process.stderr else "No error output"
+                stderr_output = self.server_process.stderr.read().decode('utf-8', errors='replace') if self.server_process.stderr else "No error output"
                 self._log(f"Server failed to start. Exit code: {self.server_process.returncode}")
                 self._log(f"Server stderr: {stderr_output}")
                 return False
             
-            self._log(f"Successfully started {server_name} server (PID: {self.server_process.pid})")
-            
+            self._log(f"Successfully started {self._server_name} server (PID: {self.server_process.pid})")
+
             # Log server start to activity tracker
             self._log_activity("SERVER_START", {
-                "server_name": server_name,
+                "server_name": self._server_name,
                 "server_pid": self.server_process.pid,
-                "command": server_config['command'],
-                "args": server_config['args']
+                "command": self._server_cmd[0],
+                "args": self._server_cmd[1:]
             })
             
             return True
@@ -225,136 +268,202 @@ class MCPWorkspaceIsolationBridge:
             self._log(f"Error starting server: {e}")
             return False
     
-    def _forward_stdin_to_server(self):
-        """Forward stdin from Claude Code to the Serena MCP server with path translation"""
+    def _translate_line(self, line: bytes) -> bytes:
+        """Translate the paths in one NDJSON-framed MCP message, returning the bytes to forward"""
+        # Fast path: no /mnt/ substring means nothing can be translated; the
+        # enabled flag is loop-invariant, so check it here once per message
+        # rather than at every node of the recursion
+        if not self._translate_paths_enabled or b'/mnt/' not in line:
+            return line
+
         try:
-            while not self.shutdown_event.is_set() and self.server_process and self.server_process.poll() is None:
-                try:
-                    # Read line from Claude Code
-                    line = sys.stdin.readline()
-                    if not line:  # EOF
-                        break
-                    
-                    # Parse and translate paths in MCP messages
-                    try:
-                        message = json.loads(line.strip())
-                        translated_message = self._translate_paths_recursive(message)
-                        translated_line = json.dumps(translated_message) + '\n'
-                        
-                        if self.debug and message != translated_message:
-                            self._log(f"Translated message: {line.strip()} -> {translated_line.strip()}")
-                    except json.JSONDecodeError:
-                        # Not a JSON message, pass through as-is
-                        translated_line = line
-                    
-                    # Check if server is still alive before writing
-                    if self.server_process and self.server_process.poll() is None and self.server_process.stdin:
-                        self.server_process.stdin.write(translated_line)
-                        self.server_process.stdin.flush()
-                        
-                except (BrokenPipeError, OSError) as e:
-                    self._log(f"Stdin forwarding error: {e}")
-                    break
-                    
-        except Exception as e:
-            self._log(f"Error in stdin forwarding: {e}")
-        finally:
+            message = _json_loads(line)
+            translated_message = self._translate_paths_recursive(message)
+            if translated_message is message:
+                # nothing was translated (e.g. /mnt/ appeared in a value
+                # that is not a path string), forward the original bytes
+                return line
+            translated_line = _json_dumps_line(translated_message)
+            if self.debug:
+                self._log(f"Translated message: {line.strip()!r} -> {translated_line.strip()!r}")
+            return translated_line
+        except ValueError:
+            # Not a JSON message, pass through as-is
+            return line
+
+    def _unregister_quietly(self, fd):
+        """Unregister a fd from the selector, ignoring fds that never got registered"""
+        try:
+            self._selector.unregister(fd)
+        except KeyError:
+            pass
+
+    def _on_stdin_readable(self):
+        """Handle readable client stdin: frame NDJSON messages and forward them translated"""
+        try:
+            chunk = os.read(self._stdin_fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            self._log(f"Stdin forwarding error: {e}")
+            self._stdin_eof = True
+            self._unregister_quietly(self._stdin_fd)
+            return
+        if not chunk:  # EOF from Claude Code
+            self._stdin_eof = True
+            self._unregister_quietly(self._stdin_fd)
             self._log("Stdin forwarding stopped")
-    
-    def _forward_server_to_stdout(self):
-        """Forward output from Serena MCP server to Claude Code"""
+            return
+
+        buf = self._stdin_buf
+        buf += chunk
+
+        # Coalesce every complete message from this read into a single
+        # write+flush, instead of a syscall pair per message; the output
+        # buffer is reused across batches to avoid reallocating it
+        out = self._out_buf
+        while (nl := buf.find(b'\n')) != -1:
+            line = bytes(buf[:nl + 1])
+            del buf[:nl + 1]
+            out += self._translate_line(line)
+
+        if out and self.server_process and self.server_process.stdin:
+            try:
+                self.server_process.stdin.write(out)
+                self.server_process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                self._log(f"Stdin forwarding error: {e}")
+            finally:
+                out.clear()
+
+    def _on_server_stdout_readable(self):
+        """Relay readable server stdout to Claude Code as a pure block passthrough"""
+        fd = self.server_process.stdout.fileno()
         try:
-            while not self.shutdown_event.is_set() and self.server_process and self.server_process.poll() is None:
-                try:
-                    # Check if server is still alive before reading
-                    if self.server_process and self.server_process.poll() is None and self.server_process.stdout:
-                        line = self.server_process.stdout.readline()
-                        if not line:  # EOF
-                            break
-                        
-                        # Forward to Claude Code
-                        sys.stdout.write(line)
-                        sys.stdout.flush()
-                        
-                except (BrokenPipeError, OSError) as e:
-                    self._log(f"Stdout forwarding error: {e}")
-                    break
-                    
-        except Exception as e:
-            self._log(f"Error in stdout forwarding: {e}")
-        finally:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            self._log(f"Stdout forwarding error: {e}")
+            self._selector.unregister(fd)
+            return
+        if not chunk:  # EOF, server is gone
+            self._selector.unregister(fd)
             self._log("Stdout forwarding stopped")
-    
-    def _monitor_server_stderr(self):
-        """Monitor server stderr for debugging"""
+            return
+
+        # No translation happens in this direction, so bypass the BufferedWriter
+        # and push the block straight to our stdout fd: one write syscall per
+        # 64KB chunk instead of a buffered write+flush pair
         try:
-            while not self.shutdown_event.is_set() and self.server_process and self.server_process.poll() is None:
-                try:
-                    # Check if server is still alive before reading
-                    if self.server_process and self.server_process.poll() is None and self.server_process.stderr:
-                        line = self.server_process.stderr.readline()
-                        if not line:
-                            break
-                        
-                        # Log server errors to our stderr
-                        self._log(f"Server stderr: {line.strip()}")
-                        
-                except Exception as e:
-                    self._log(f"Error monitoring server stderr: {e}")
-                    break
-                    
-        except Exception as e:
-            self._log(f"Error in stderr monitoring: {e}")
-    
+            written = 0
+            while written < len(chunk):
+                written += os.write(self._stdout_fd, chunk[written:])
+        except (BrokenPipeError, OSError) as e:
+            self._log(f"Stdout forwarding error: {e}")
+
+    def _on_server_stderr_readable(self):
+        """Log readable server stderr line by line for debugging"""
+        fd = self.server_process.stderr.fileno()
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            self._log(f"Error monitoring server stderr: {e}")
+            self._selector.unregister(fd)
+            return
+        if not chunk:
+            self._selector.unregister(fd)
+            return
+
+        buf = self._stderr_buf
+        buf += chunk
+        while (nl := buf.find(b'\n')) != -1:
+            line = bytes(buf[:nl])
+            del buf[:nl + 1]
+            self._log(f"Server stderr: {line.decode('utf-8', errors='replace').strip()}")
+
     def run(self):
         """Main execution loop"""
         self._start_time = time.time()  # Track start time for uptime calculation
         self._log("Starting MCP Workspace Isolation Bridge...")
-        
+
         # Start the dedicated MCP server
         if not self._start_dedicated_server():
             self._log("Failed to start MCP server, exiting")
             sys.exit(1)
-        
-        # Start forwarding threads
-        stdin_thread = threading.Thread(
-            target=self._forward_stdin_to_server,
-            daemon=True,
-            name=f"stdin-forward-{self.workspace_id}"
-        )
-        
-        stdout_thread = threading.Thread(
-            target=self._forward_server_to_stdout,
-            daemon=True,
-            name=f"stdout-forward-{self.workspace_id}"
-        )
-        
-        stderr_thread = threading.Thread(
-            target=self._monitor_server_stderr,
-            daemon=True,
-            name=f"stderr-monitor-{self.workspace_id}"
-        )
-        
-        # Start all threads
-        stdin_thread.start()
-        stdout_thread.start()
-        stderr_thread.start()
-        
+
+        # Multiplex all three pipes from a single selector loop instead of one
+        # blocking-read thread per direction: no GIL hand-offs or cross-thread
+        # wakeups, and one loop iteration can drain several pipes at once
+        self._selector = selectors.DefaultSelector()
+        self._stdin_fd = sys.stdin.fileno()
+        self._stdout_fd = sys.stdout.fileno()
+        self._stdin_buf = bytearray()
+        self._stderr_buf = bytearray()
+        self._out_buf = bytearray()
+        self._stdin_eof = False
+
+        unpollable_stdin = False
+        for fd, handler in (
+            (self._stdin_fd, self._on_stdin_readable),
+            (self.server_process.stdout.fileno(), self._on_server_stdout_readable),
+            (self.server_process.stderr.fileno(), self._on_server_stderr_readable),
+        ):
+            os.set_blocking(fd, False)
+            try:
+                self._selector.register(fd, selectors.EVENT_READ, handler)
+            except OSError:
+                # epoll rejects non-pollable fds (a regular file or /dev/null as
+                # stdin) with EPERM; such fds are always ready, so drain instead
+                if fd == self._stdin_fd:
+                    unpollable_stdin = True
+                else:
+                    raise
+
+        if unpollable_stdin:
+            # Files and /dev/null never block, so forward all of stdin up front
+            while not self._stdin_eof:
+                self._on_stdin_readable()
+
+        # On Linux, register a pidfd so server exit wakes the selector directly;
+        # the loop then never needs to poll the child at idle
+        pidfd = None
+        if hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(self.server_process.pid)
+                self._selector.register(pidfd, selectors.EVENT_READ, None)
+            except OSError:
+                # pidfd_open unavailable, or registration failed because the
+                # server already exited; fall back to polling
+                if pidfd is not None:
+                    os.close(pidfd)
+                pidfd = None
+
         self._log("MCP bridge active, forwarding communications...")
-        
+
         try:
             # Wait for server process to end or shutdown signal
             while not self.shutdown_event.is_set():
-                if self.server_process.poll() is not None:
-                    self._log(f"MCP server process ended with code: {self.server_process.returncode}")
+                server_exited = False
+                for key, _ in self._selector.select(timeout=1.0):
+                    if key.data is None:  # pidfd became readable: server exited
+                        server_exited = True
+                    else:
+                        key.data()
+                if server_exited or (pidfd is None and self.server_process.poll() is not None):
+                    self._log(f"MCP server process ended with code: {self.server_process.poll()}")
                     break
-                time.sleep(0.1)
-                
+
         except KeyboardInterrupt:
             self._log("Received keyboard interrupt")
         finally:
+            self._selector.close()
+            if pidfd is not None:
+                os.close(pidfd)
             self.shutdown()
-    
+
     def shutdown(self):
         """Clean shutdown of wrapper and server"""
         if self.shutdown_event.is_set():
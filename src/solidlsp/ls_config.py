@@ -3,8 +3,11 @@ Configuration objects for language servers
 """
 
 import fnmatch
+import os
+import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 
 class FilenameMatcher:
@@ -13,12 +16,14 @@ class FilenameMatcher:
         :param patterns: fnmatch-compatible patterns
         """
         self.patterns = patterns
+        # fuse all patterns into a single alternation regex, so matching a filename
+        # is one regex evaluation instead of one fnmatch call per pattern
+        self._regex = re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)) if patterns else None
 
     def is_relevant_filename(self, fn: str) -> bool:
-        for pattern in self.patterns:
-            if fnmatch.fnmatch(fn, pattern):
-                return True
-        return False
+        if self._regex is None:
+            return False
+        return self._regex.match(os.path.normcase(fn)) is not None
 
 
 class Language(str, Enum):
@@ -44,6 +49,7 @@ class Language(str, Enum):
     def __str__(self) -> str:
         return self.value
 
+    @lru_cache(maxsize=None)
     def get_source_fn_matcher(self) -> FilenameMatcher:
         match self:
             case self.PYTHON:
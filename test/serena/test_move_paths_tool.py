@@ -9,9 +9,9 @@ from serena.tools import MovePathsTool
 def tool():
     return MovePathsTool()
 
-@pytest.fixture
-def test_dir(tmp_path):
-    """Creates a test directory structure:
+@pytest.fixture(scope="session")
+def _tree_proto(tmp_path_factory):
+    """Builds the prototype test directory structure once per session:
     test_dir/
     ├── dir1/
     │   ├── file1.txt
@@ -21,19 +21,28 @@ def test_dir(tmp_path):
     ├── file2.txt
     └── file3.txt
     """
-    dir1 = tmp_path / "dir1"
+    base = tmp_path_factory.mktemp("proto")
+    dir1 = base / "dir1"
     dir1.mkdir()
     (dir1 / "file1.txt").write_text("file1 content")
     subdir1 = dir1 / "subdir1"
     subdir1.mkdir()
     (subdir1 / "subfile1.txt").write_text("subfile1 content")
 
-    dir2 = tmp_path / "dir2"
+    dir2 = base / "dir2"
     dir2.mkdir()
 
-    (tmp_path / "file2.txt").write_text("file2 content")
-    (tmp_path / "file3.txt").write_text("file3 content")
-    
+    (base / "file2.txt").write_text("file2 content")
+    (base / "file3.txt").write_text("file3 content")
+
+    return base
+
+
+@pytest.fixture
+def test_dir(tmp_path, _tree_proto):
+    # Each test still gets its own mutable copy, but via a single copytree
+    # instead of rebuilding the tree file by file
+    shutil.copytree(_tree_proto, tmp_path, dirs_exist_ok=True)
     return tmp_path
 
 def test_move_single_file_dry_run(tool, test_dir):
@@ -62,6 +62,39 @@ class TestShellCommandExecution:
             with pytest.raises(ValueError, match="Command blocked for safety"):
                 _validate_command_safety(cmd)
 
+    def test_safety_matcher_is_precompiled(self):
+        """Test that the dangerous-command matcher is a module-level compiled singleton."""
+        import re
+
+        from serena.util import shell
+
+        assert hasattr(shell, "_DANGEROUS_RE")
+        assert isinstance(shell._DANGEROUS_RE, re.Pattern)
+        # The same compiled pattern must be reused across calls, not rebuilt
+        before = shell._DANGEROUS_RE
+        _validate_command_safety("echo hello")
+        assert shell._DANGEROUS_RE is before
+
+    def test_validator_fast_path_ordering(self, monkeypatch):
+        """Test that the full pattern is not consulted when the keyword prescreen clears a command."""
+        from unittest.mock import Mock
+
+        from serena.util import shell
+
+        full_pattern = Mock(wraps=shell._DANGEROUS_RE)
+        monkeypatch.setattr(shell, "_DANGEROUS_RE", full_pattern)
+
+        # No dangerous keyword appears at all, so the cheap literal scan must
+        # decide alone and the grouped regex must never run
+        _validate_command_safety("echo hello")
+        _validate_command_safety("git status")
+        full_pattern.search.assert_not_called()
+
+        # A keyword hit falls through to the full pattern, which decides
+        with pytest.raises(ValueError, match="Command blocked for safety"):
+            _validate_command_safety("rm -rf /")
+        full_pattern.search.assert_called()
+
     def test_safe_command_validation(self):
         """Test that safe commands pass validation."""
         safe_commands = [
@@ -108,4 +141,15 @@ class TestShellCommandResult:
         )
         
         assert result.stderr == "error message"
-        assert result.return_code == 1
\ No newline at end of file
+        assert result.return_code == 1
+
+    def test_result_model_is_slotted_and_frozen(self):
+        """Test that instances use slots (no per-instance dict) and are immutable."""
+        from serena.util.shell import ShellCommandResult
+
+        result = ShellCommandResult(stdout="output", return_code=0, cwd="/tmp")
+
+        assert hasattr(ShellCommandResult, "__slots__")
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.stdout = "changed"
\ No newline at end of file
@@ -4,121 +4,64 @@ Test MCP communication through the Workspace Isolation Bridge
 """
 
 import json
-import subprocess
-import time
-import threading
+import select
 import sys
 
-def test_mcp_communication():
-    """Test basic MCP communication through the bridge"""
-    print("🧪 Testing MCP Communication through Workspace Isolation Bridge")
-    print("=" * 60)
-    
-    # Start the bridge
-    bridge_cmd = [
-        "uv", "run", 
-        "--directory", "E:\\_ProjectBroadside\\serena",
-        "serena-workspace-isolation-bridge", 
-        "--config", "test_bridge_config.json",
-        "--debug"
-    ]
-    
-    print(f"Starting bridge: {' '.join(bridge_cmd)}")
-    
-    try:
-        process = subprocess.Popen(
-            bridge_cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        # Give it time to start
-        time.sleep(2)
-        
-        # Check if bridge started successfully
-        if process.poll() is not None:
-            stderr_output = process.stderr.read()
-            print(f"❌ Bridge failed to start. Exit code: {process.returncode}")
-            print(f"Error output: {stderr_output}")
-            return False
-        
-        print("✅ Bridge started successfully")
-        
-        # Test basic MCP initialization
-        init_request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {
-                    "roots": {
-                        "listChanged": True
-                    },
-                    "sampling": {}
+import pytest
+
+try:
+    import orjson  # optional C-accelerated JSON codec for the message path
+except ImportError:
+    orjson = None
+
+
+def _dumps_line(obj):
+    """Serialize a JSON-RPC message to newline-terminated UTF-8 bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
+def _loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+@pytest.mark.integration
+def test_mcp_communication(bridge_process):
+    """Test basic MCP communication through the shared bridge."""
+    init_request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {
+                "roots": {
+                    "listChanged": True
                 },
-                "clientInfo": {
-                    "name": "test-client",
-                    "version": "1.0.0"
-                }
+                "sampling": {}
+            },
+            "clientInfo": {
+                "name": "test-client",
+                "version": "1.0.0"
             }
         }
-        
-        print("📤 Sending initialize request...")
-        process.stdin.write(json.dumps(init_request) + "\n")
-        process.stdin.flush()
-        
-        # Read response with timeout
-        def read_response():
-            try:
-                response_line = process.stdout.readline()
-                if response_line:
-                    return json.loads(response_line.strip())
-            except:
-                return None
-            return None
-        
-        # Wait for response
-        response = None
-        for _ in range(10):  # 5 second timeout
-            response = read_response()
-            if response:
-                break
-            time.sleep(0.5)
-        
-        if response:
-            print("📥 Received response:")
-            print(json.dumps(response, indent=2))
-            
-            if response.get("result"):
-                print("✅ MCP initialization successful!")
-                success = True
-            else:
-                print("❌ MCP initialization failed")
-                success = False
-        else:
-            print("❌ No response received from bridge")
-            success = False
-        
-        # Clean shutdown
-        print("🛑 Shutting down bridge...")
-        process.terminate()
-        process.wait(timeout=5)
-        
-        return success
-        
-    except Exception as e:
-        print(f"❌ Test failed with exception: {e}")
-        if 'process' in locals():
-            try:
-                process.terminate()
-                process.wait(timeout=5)
-            except:
-                pass
-        return False
+    }
+
+    bridge_process.stdin.write(_dumps_line(init_request))
+    bridge_process.stdin.flush()
+
+    # Wait for the response with a single select instead of a poll/sleep
+    # loop: blocks exactly as long as needed, up to the 5s timeout
+    readable, _, _ = select.select([bridge_process.stdout], [], [], 5.0)
+    assert readable, "No response received from bridge within 5s"
+
+    response_line = bridge_process.stdout.readline()
+    assert response_line.strip(), "Empty response from bridge"
+
+    response = _loads(response_line.strip())
+    assert response.get("result"), f"MCP initialization failed: {response}"
+
 
 if __name__ == "__main__":
-    success = test_mcp_communication()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -13,10 +13,24 @@ import time
 import subprocess
 import threading
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 import logging
 
+try:
+    import orjson  # optional C-accelerated JSON parser for the log hot path
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Bridge log filename prefix, with its length precomputed so the per-entry
+# check in the temp-dir scan is a single fixed-size slice compare (a C-level
+# memcmp) rather than a method call
+_LOG_PREFIX = "serena_bridge_workspace_isolation_bridge_"
+_LOG_PREFIX_LEN = len(_LOG_PREFIX)
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,11 +41,24 @@ logger = logging.getLogger(__name__)
 class WorkspaceIsolationBridgeTest:
     """Test suite for validating Workspace Isolation Bridge functionality"""
     
+    # The same launch command and temp dir are used by every test; build them
+    # once instead of per test body
+    _BRIDGE_CMD = (
+        "uv", "run", "--directory", "E:\\_ProjectBroadside\\serena",
+        "serena-workspace-isolation-bridge", "--debug"
+    )
+
     def __init__(self):
         self.test_results = []
         self.bridge_processes = []
-        self.activity_log_file = os.path.join(tempfile.gettempdir(), 'workspace_isolation_bridge_activity.log')
-        
+        self.shared_bridge = None
+        self._tmp = tempfile.gettempdir()
+        self.activity_log_file = os.path.join(self._tmp, 'workspace_isolation_bridge_activity.log')
+        # Incremental activity-log state: entries parsed so far and the file
+        # offset they end at, so repeated reads only parse new lines
+        self._activities: List[Dict[str, Any]] = []
+        self._log_pos = 0
+
     def log_test_result(self, test_name: str, passed: bool, details: str = ""):
         """Log test result"""
         result = {
@@ -49,97 +76,98 @@ class WorkspaceIsolationBridgeTest:
         try:
             if os.path.exists(self.activity_log_file):
                 os.remove(self.activity_log_file)
+            self._activities = []
+            self._log_pos = 0
             logger.info("Cleared activity log")
         except Exception as e:
             logger.warning(f"Could not clear activity log: {e}")
-    
+
     def read_activity_log(self) -> List[Dict[str, Any]]:
-        """Read and parse activity log entries"""
-        activities = []
+        """Read and parse activity log entries.
+
+        The log is append-only, so only lines past the last-read offset are
+        parsed; earlier entries are served from memory. This keeps repeated
+        reads (e.g. readiness polling) from re-decoding the whole file.
+        """
         try:
             if os.path.exists(self.activity_log_file):
                 with open(self.activity_log_file, 'r', encoding='utf-8') as f:
+                    f.seek(self._log_pos)
                     for line in f:
                         line = line.strip()
                         if line:
                             try:
-                                activities.append(json.loads(line))
+                                self._activities.append(_json_loads(line))
                             except json.JSONDecodeError as e:
                                 logger.warning(f"Could not parse activity log line: {line} - {e}")
+                    self._log_pos = f.tell()
         except Exception as e:
             logger.error(f"Error reading activity log: {e}")
-        return activities
+        return self._activities
     
+    def setup_shared_bridge(self) -> bool:
+        """Start the single bridge instance shared by the non-isolation tests.
+
+        Spawning a fresh `uv run` bridge per test costs seconds of pure startup
+        overhead; the tests that only inspect the activity log can all observe
+        the same process. Readiness is detected by polling the activity log for
+        the BRIDGE_START event instead of a blind sleep.
+        """
+        self.clear_activity_log()
+
+        self.shared_bridge = subprocess.Popen(
+            self._BRIDGE_CMD,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+
+        # Wait (bounded) until the bridge has logged its startup event
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            if self.shared_bridge.poll() is not None:
+                return False
+            if any(a.get("event_type") == "BRIDGE_START" for a in self.read_activity_log()):
+                return True
+            time.sleep(0.05)
+        return False
+
+    def teardown_shared_bridge(self):
+        """Terminate the shared bridge instance"""
+        if self.shared_bridge is None:
+            return
+        try:
+            self.shared_bridge.terminate()
+            self.shared_bridge.wait(timeout=5)
+        except Exception as e:
+            logger.warning(f"Could not terminate shared bridge: {e}")
+
     def test_single_bridge_startup(self) -> bool:
         """Test 1: Single bridge starts up correctly"""
         logger.info("=== Test 1: Single Bridge Startup ===")
-        
+
         try:
-            # Start a single bridge instance
-            cmd = [
-                "uv", "run", "--directory", "E:\\_ProjectBroadside\\serena",
-                "serena-workspace-isolation-bridge", "--debug"
-            ]
-            
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            # Give it time to start
-            time.sleep(3)
-            
-            # Check if process is running
-            if process.poll() is None:
+            # The shared bridge was started in setup; it just has to be alive
+            if self.shared_bridge is not None and self.shared_bridge.poll() is None:
                 self.log_test_result("single_bridge_startup", True, "Bridge process started successfully")
-                
-                # Terminate the process
-                process.terminate()
-                process.wait(timeout=5)
                 return True
             else:
-                stderr_output = process.stderr.read() if process.stderr else "No error output"
-                self.log_test_result("single_bridge_startup", False, f"Bridge failed to start: {stderr_output}")
+                self.log_test_result("single_bridge_startup", False, "Bridge failed to start")
                 return False
-                
+
         except Exception as e:
             self.log_test_result("single_bridge_startup", False, f"Exception during startup: {e}")
             return False
-    
+
     def test_activity_logging(self) -> bool:
         """Test 2: Activity logging works correctly"""
         logger.info("=== Test 2: Activity Logging ===")
-        
-        self.clear_activity_log()
-        
+
         try:
-            # Start bridge and let it run briefly
-            cmd = [
-                "uv", "run", "--directory", "E:\\_ProjectBroadside\\serena",
-                "serena-workspace-isolation-bridge", "--debug"
-            ]
-            
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            # Give it time to start and log
-            time.sleep(2)
-            
-            # Terminate
-            process.terminate()
-            process.wait(timeout=5)
-            
-            # Check activity log
+            # The shared bridge has already logged its startup
             activities = self.read_activity_log()
-            
+
             if len(activities) >= 1:
                 # Look for BRIDGE_START event
                 bridge_start_found = any(
@@ -168,38 +196,50 @@ class WorkspaceIsolationBridgeTest:
         self.clear_activity_log()
         
         try:
-            processes = []
-            
-            # Start 3 bridge instances simultaneously
-            for i in range(3):
-                cmd = [
-                    "uv", "run", "--directory", "E:\\_ProjectBroadside\\serena",
-                    "serena-workspace-isolation-bridge", "--debug"
-                ]
-                
-                process = subprocess.Popen(
-                    cmd,
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
+            # Start 3 bridge instances concurrently: fork/exec of `uv run` is
+            # heavyweight, so overlapping the launches costs max(startup)
+            # instead of the sum
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                processes = list(executor.map(
+                    lambda _: subprocess.Popen(
+                        self._BRIDGE_CMD,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        text=True
+                    ),
+                    range(3)
+                ))
+
+            # Wait until all three bridges have logged their startup event,
+            # bounded by a deadline, instead of a fixed sleep
+            deadline = time.monotonic() + 5.0
+            while time.monotonic() < deadline:
+                starts = sum(
+                    1 for a in self.read_activity_log()
+                    if a.get("event_type") == "BRIDGE_START"
                 )
-                processes.append(process)
-                
-                # Small delay between starts
-                time.sleep(0.5)
-            
-            # Let them all run for a bit
-            time.sleep(3)
-            
-            # Terminate all
+                if starts >= 3:
+                    break
+                time.sleep(0.05)
+
+            # Signal all bridges first, then wait against one shared deadline,
+            # so slow exiters overlap instead of each costing up to 5s serially
             for process in processes:
                 try:
                     process.terminate()
-                    process.wait(timeout=5)
-                except:
+                except Exception:
                     pass
-            
+            deadline = time.monotonic() + 5.0
+            for process in processes:
+                try:
+                    process.wait(timeout=max(0, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                except Exception:
+                    pass
+
             # Analyze activity log
             activities = self.read_activity_log()
             
@@ -230,29 +270,9 @@ class WorkspaceIsolationBridgeTest:
     def test_workspace_id_format(self) -> bool:
         """Test 4: Workspace ID format is correct"""
         logger.info("=== Test 4: Workspace ID Format ===")
-        
-        self.clear_activity_log()
-        
+
         try:
-            # Start a bridge
-            cmd = [
-                "uv", "run", "--directory", "E:\\_ProjectBroadside\\serena",
-                "serena-workspace-isolation-bridge", "--debug"
-            ]
-            
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            time.sleep(2)
-            process.terminate()
-            process.wait(timeout=5)
-            
-            # Check workspace ID format
+            # Check workspace ID format in the shared bridge's startup event
             activities = self.read_activity_log()
             
             for activity in activities:
@@ -277,31 +297,14 @@ class WorkspaceIsolationBridgeTest:
         logger.info("=== Test 5: Log File Creation ===")
         
         try:
-            # Start a bridge
-            cmd = [
-                "uv", "run", "--directory", "E:\\_ProjectBroadside\\serena",
-                "serena-workspace-isolation-bridge", "--debug"
-            ]
-            
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            time.sleep(2)
-            process.terminate()
-            process.wait(timeout=5)
-            
-            # Check for log files in temp directory
-            temp_dir = tempfile.gettempdir()
-            log_files = [f for f in os.listdir(temp_dir) if f.startswith("serena_bridge_workspace_isolation_bridge_")]
-            
-            if len(log_files) >= 1:
-                self.log_test_result("log_file_creation", True, 
-                                   f"Found {len(log_files)} bridge log files")
+            # The shared bridge has created its log file by now; scan the temp
+            # directory lazily and stop at the first match instead of
+            # materializing every filename just to filter it
+            with os.scandir(self._tmp) as it:
+                log_file_found = any(entry.name[:_LOG_PREFIX_LEN] == _LOG_PREFIX for entry in it)
+
+            if log_file_found:
+                self.log_test_result("log_file_creation", True, "Found bridge log file")
                 return True
             else:
                 self.log_test_result("log_file_creation", False, "No bridge log files found")
@@ -317,26 +320,35 @@ class WorkspaceIsolationBridgeTest:
         logger.info("=" * 60)
         
         start_time = time.time()
-        
-        # Run all tests
+
+        # One shared bridge serves every test that only inspects the activity
+        # log; the isolation test last spawns (and clears the log for) its own
+        # three bridges, so it must run after the shared-bridge tests
+        shared_bridge_ready = self.setup_shared_bridge()
+        if not shared_bridge_ready:
+            logger.error("Shared bridge failed to become ready")
+
         tests = [
             self.test_single_bridge_startup,
             self.test_activity_logging,
-            self.test_multiple_bridge_isolation,
             self.test_workspace_id_format,
-            self.test_log_file_creation
+            self.test_log_file_creation,
+            self.test_multiple_bridge_isolation
         ]
-        
+
         passed_tests = 0
         total_tests = len(tests)
-        
-        for test_func in tests:
-            try:
-                if test_func():
-                    passed_tests += 1
-            except Exception as e:
-                logger.error(f"Test {test_func.__name__} failed with exception: {e}")
-        
+
+        try:
+            for test_func in tests:
+                try:
+                    if test_func():
+                        passed_tests += 1
+                except Exception as e:
+                    logger.error(f"Test {test_func.__name__} failed with exception: {e}")
+        finally:
+            self.teardown_shared_bridge()
+
         end_time = time.time()
         duration = end_time - start_time
         
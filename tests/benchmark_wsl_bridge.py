@@ -1,49 +1,99 @@
 """Benchmark file access performance with and without the bridge"""
 
+import array
 import time
 import subprocess
-import statistics
+
+def _sample_adaptive(time_one_ns, min_samples=20, max_samples=200):
+    """Collect timing samples until the answer stops changing, returning stats.
+
+    Runs `time_one_ns` (which returns one sample in nanoseconds) with an
+    online Welford mean/variance, and stops once the 95% confidence
+    half-width drops below 2% of the mean - stable paths (warm page cache)
+    finish in ~20 iterations while noisy ones run up to `max_samples`.
+
+    Mean and stdev come straight from the Welford accumulators and
+    median/min/max from one sort, so no separate per-statistic pass over
+    the samples is needed. All values are in milliseconds.
+    """
+    times_ns = array.array('q', [0] * max_samples)
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    stdev = 0.0
+    while n < max_samples:
+        t = time_one_ns()
+        times_ns[n] = t
+        n += 1
+        delta = t - mean
+        mean += delta / n
+        m2 += delta * (t - mean)
+        if n >= min_samples:
+            stdev = (m2 / (n - 1)) ** 0.5
+            ci_half_width = 1.96 * stdev / n ** 0.5
+            if ci_half_width < 0.02 * mean:
+                break
+    ordered = sorted(times_ns[:n])
+    mid = n // 2
+    median = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+    return {
+        'mean': mean / 1e6,
+        'median': median / 1e6,
+        'stdev': stdev / 1e6,
+        'min': ordered[0] / 1e6,
+        'max': ordered[-1] / 1e6
+    }
 
 def benchmark_direct_wsl_access():
     """Benchmark direct file access from WSL"""
-    times = []
     test_file = "/mnt/c/Windows/System32/drivers/etc/hosts"
-    
-    for _ in range(100):
-        start = time.time()
-        with open(test_file, 'r') as f:
-            content = f.read()
-        times.append((time.time() - start) * 1000)  # ms
-    
-    return {
-        'mean': statistics.mean(times),
-        'median': statistics.median(times),
-        'stdev': statistics.stdev(times),
-        'min': min(times),
-        'max': max(times)
-    }
+
+    # perf_counter_ns is monotonic and cheaper than time.time, and the
+    # preallocated int array keeps list-resize copies and float math out of
+    # the measured loop; ns -> ms conversion happens once at the end
+    def time_one_ns():
+        start = time.perf_counter_ns()
+        # binary read: the benchmark targets file I/O, not UTF-8 decoding
+        with open(test_file, 'rb') as f:
+            f.read()
+        return time.perf_counter_ns() - start
+
+    return _sample_adaptive(time_one_ns)
 
 def benchmark_windows_native():
     """Benchmark native Windows file access"""
-    times = []
-    
-    for _ in range(100):
-        start = time.time()
-        result = subprocess.run(
-            ['powershell.exe', '-Command', 
-             '[IO.File]::ReadAllText("C:\\Windows\\System32\\drivers\\etc\\hosts")'],
-            capture_output=True,
-            text=True
-        )
-        times.append((time.time() - start) * 1000)  # ms
-    
-    return {
-        'mean': statistics.mean(times),
-        'median': statistics.median(times),
-        'stdev': statistics.stdev(times),
-        'min': min(times),
-        'max': max(times)
-    }
+    # One persistent PowerShell fed over stdin instead of a fresh powershell.exe
+    # per iteration: spawning the process costs tens to hundreds of ms, which
+    # would make this a process-creation benchmark rather than a file-access one.
+    # A sentinel line marks the end of each response.
+    proc = subprocess.Popen(
+        ['powershell.exe', '-NoProfile', '-NonInteractive', '-Command', '-'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        bufsize=1
+    )
+    request = '[IO.File]::ReadAllText("C:\\Windows\\System32\\drivers\\etc\\hosts"); Write-Host "__END__"\n'
+
+    def roundtrip():
+        proc.stdin.write(request)
+        proc.stdin.flush()
+        while proc.stdout.readline().rstrip('\n') != '__END__':
+            pass
+
+    def time_one_ns():
+        start = time.perf_counter_ns()
+        roundtrip()
+        return time.perf_counter_ns() - start
+
+    try:
+        # Warm-up request so JIT/startup work is not charged to the first sample
+        roundtrip()
+        return _sample_adaptive(time_one_ns)
+    finally:
+        proc.stdin.close()
+        proc.wait()
 
 if __name__ == "__main__":
     print("Benchmarking file access performance...\n")
@@ -2,50 +2,106 @@
 
 import subprocess
 import json
+import selectors
+import sys
 import time
 import os
 import tempfile
 
+import pytest
+
+# Computed once at import: every test invocation reused the same paths and
+# the same static bridge config, so there is no reason to redo the
+# realpath/getcwd syscalls and JSON encoding per call
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC_PATH = os.path.join(PROJECT_ROOT, 'src')
+TEST_CONFIG_JSON_BYTES = json.dumps({
+    "mcpServers": {
+        "serena": {
+            "command": "python",
+            "args": ["-m", "serena.mcp_server", "--test-mode"],
+            "env": {
+                "PYTHONPATH": SRC_PATH
+            }
+        }
+    },
+    "bridge": {
+        "debug": True
+    }
+}).encode()
+
+@pytest.mark.bridge
 def test_windows_execution():
     """Test Q1: Can WSL launch Windows executables?"""
     print("Testing Windows executable launch from WSL...")
     
-    # Test 1: Basic cmd.exe
-    result = subprocess.run(
-        ['cmd.exe', '/c', 'echo', 'Hello from Windows'],
-        capture_output=True,
-        text=True
-    )
+    # Test 1: Basic cmd.exe. The output is only printed, never asserted, so
+    # send it to DEVNULL by default - the smoke test becomes a pure
+    # launch-roundtrip probe with no pipe copy or decode. Set DEBUG_WSL to
+    # see the echoed output.
+    echo_cmd = ['cmd.exe', '/c', 'echo', 'Hello from Windows']
+    if os.environ.get("DEBUG_WSL"):
+        result = subprocess.run(echo_cmd, capture_output=True, text=True, timeout=5)
+        print(f"Output: {result.stdout.strip()}")
+    else:
+        result = subprocess.run(
+            echo_cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=5
+        )
     print(f"cmd.exe test: {result.returncode == 0}")
-    print(f"Output: {result.stdout.strip()}")
-    
-    # Test 2: Windows Python
-    win_python_paths = [
-        '/mnt/c/Python312/python.exe',
-        '/mnt/c/Python311/python.exe',
-        '/mnt/c/Python310/python.exe',
-        '/mnt/c/Python39/python.exe',
-    ]
-    
+
+    # Test 2: Windows Python. One `where python` spawn returns every python.exe
+    # on the Windows PATH, instead of stat'ing /mnt/c/... candidates one by one
+    # (each os.path.exists on /mnt/c is a WSL->9p crossing)
+    candidate_paths = []
+    try:
+        where_result = subprocess.run(
+            ['cmd.exe', '/c', 'where', 'python'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if where_result.returncode == 0:
+            candidate_paths = where_result.stdout.splitlines()
+    except (subprocess.SubprocessError, OSError):
+        pass
+
+    if not candidate_paths:
+        # Fallback for environments where `where` is unavailable
+        candidate_paths = [
+            '/mnt/c/Python312/python.exe',
+            '/mnt/c/Python311/python.exe',
+            '/mnt/c/Python310/python.exe',
+            '/mnt/c/Python39/python.exe',
+        ]
+
     python_found = False
-    for path in win_python_paths:
-        if os.path.exists(path):
-            result = subprocess.run(
+    for path in candidate_paths:
+        path = path.strip()
+        if not path:
+            continue
+        try:
+            python_result = subprocess.run(
                 [path, '-c', 'print("Python on Windows works!")'],
                 capture_output=True,
                 text=True
             )
-            if result.returncode == 0:
-                print(f"Windows Python found at: {path}")
-                print(f"Output: {result.stdout.strip()}")
-                python_found = True
-                break
-    
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if python_result.returncode == 0:
+            print(f"Windows Python found at: {path}")
+            print(f"Output: {python_result.stdout.strip()}")
+            python_found = True
+            break
+
     if not python_found:
         print("WARNING: No Windows Python found. Please install Python on Windows.")
-    
+
     return result.returncode == 0
 
+@pytest.mark.bridge
 def test_path_translation():
     """Test Q2: Path translation in MCP messages"""
     print("\nTesting path translation...")
@@ -63,59 +119,44 @@ def test_path_translation():
         }
     }
     
-    # This would be handled by the bridge's _translate_paths_recursive
-    print(f"Original: {test_message['params']['arguments']['path']}")
-    print(f"Expected: C:\\Users\\TestUser\\project\\file.cs")
-    
-    return True
+    # Exercise the bridge's actual translator instead of printing the
+    # expectation: this is the hot loop of the message path, so any rewrite
+    # of it gets a correctness gate here
+    from serena.wsl_bridge._pathxlat import translate_paths
 
-import tempfile
+    translated = translate_paths(test_message)
+    assert translated["params"]["arguments"]["path"] == "C:\\Users\\TestUser\\project\\file.cs"
+    # The input message must not be mutated in place
+    assert test_message["params"]["arguments"]["path"] == "/mnt/c/Users/TestUser/project/file.cs"
 
+    return True
+
+@pytest.mark.bridge
 def test_serena_connection():
     """Test full bridge connection"""
     print("\nTesting Serena connection through bridge...")
 
-    # Get the project root directory
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-    src_path = os.path.join(project_root, 'src')
-
-    # Create a test configuration
-    test_config = {
-        "mcpServers": {
-            "serena": {
-                "command": "python",
-                "args": ["-m", "serena.mcp_server", "--test-mode"],
-                "env": {
-                    "PYTHONPATH": src_path
-                }
-            }
-        },
-        "bridge": {
-            "debug": True
-        }
-    }
-
-    # Save test config to a temporary file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".json") as f:
-        json.dump(test_config, f)
-        config_path = f.name
+    # Save the precomputed test config to a temporary file: mkstemp plus one
+    # os.write of the ready bytes - no buffered text wrapper, and the file is
+    # fully on disk before the bridge subprocess can read it
+    fd, config_path = tempfile.mkstemp(suffix=".json")
+    os.write(fd, TEST_CONFIG_JSON_BYTES)
+    os.close(fd)
 
     try:
-        # Get the project root directory
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-        src_path = os.path.join(project_root, 'src')
-
         # Set up environment for the subprocess
         env = os.environ.copy()
-        env['PYTHONPATH'] = src_path + os.pathsep + env.get('PYTHONPATH', '')
+        env['PYTHONPATH'] = SRC_PATH + os.pathsep + env.get('PYTHONPATH', '')
 
-        # Start the bridge
+        # Start the bridge with binary unbuffered pipes: JSON-RPC is UTF-8
+        # (no decode needed in flight), and draining stderr below means a
+        # verbose -d bridge cannot deadlock on a full 64KB pipe
         bridge_process = subprocess.Popen(
             ['python', 'scripts/serena-wsl-bridge.py', '-c', config_path, '-d'],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
+            bufsize=0,
             env=env
         )
 
@@ -127,11 +168,26 @@ def test_serena_connection():
             "params": {"capabilities": {}}
         }
 
-        bridge_process.stdin.write(json.dumps(test_request) + '\n')
+        bridge_process.stdin.write((json.dumps(test_request) + '\n').encode())
         bridge_process.stdin.flush()
 
-        # Wait for response
-        time.sleep(2)
+        # Drain both pipes until a response arrives (or the 2s deadline)
+        # instead of always sleeping the full 2s
+        stdout_buf = bytearray()
+        stderr_buf = bytearray()
+        with selectors.DefaultSelector() as selector:
+            selector.register(bridge_process.stdout, selectors.EVENT_READ, stdout_buf)
+            selector.register(bridge_process.stderr, selectors.EVENT_READ, stderr_buf)
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline and not stdout_buf:
+                if bridge_process.poll() is not None:
+                    break
+                for key, _ in selector.select(timeout=0.05):
+                    chunk = os.read(key.fd, 65536)
+                    if chunk:
+                        key.data.extend(chunk)
+                    else:
+                        selector.unregister(key.fileobj)
 
         # Check if bridge is still running
         if bridge_process.poll() is None:
@@ -139,31 +195,10 @@ def test_serena_connection():
             bridge_process.terminate()
             return True
         else:
-            stderr = bridge_process.stderr.read()
-            print(f"Bridge failed: {stderr}")
+            print(f"Bridge failed: {stderr_buf.decode('utf-8', 'replace')}")
             return False
     finally:
         os.remove(config_path)
 
 if __name__ == "__main__":
-    print("=== Serena Workspace Isolation Bridge Test Suite ===\n")
-    
-    tests = [
-        ("Windows Execution", test_windows_execution),
-        ("Path Translation", test_path_translation),
-        ("Serena Connection", test_serena_connection)
-    ]
-    
-    results = []
-    for name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((name, result))
-        except Exception as e:
-            print(f"Error in {name}: {e}")
-            results.append((name, False))
-    
-    print("\n=== Test Results ===")
-    for name, result in results:
-        status = "PASS" if result else "FAIL"
-        print(f"{name}: {status}")
+    sys.exit(pytest.main([__file__, "-v"]))